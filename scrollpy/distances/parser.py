@@ -50,10 +50,7 @@ def _parse_raxml_distances(file_path):
             #    distances[int(key)] += float(d)
             #except KeyError: # first time seeing the key
             #    distances[int(key)] = float(d)
-            try:
-                distances[key] += float(d)
-            except KeyError:
-                distances[key] = float(d)
+            distances[key] = distances.get(key, 0.0) + float(d)
     return distances
 
 def _parse_phyml_distances(file_path):
@@ -106,28 +106,16 @@ class SeqWriter(BaseWriter):
         if removed:  # Simply want ALL removed sequences
             for obj in self._sp_object.return_removed_seqs():
                 group = obj._group
-                try:
-                    seqs[group].append(obj)
-                except KeyError:
-                    seqs[group] = []
-                    seqs[group].append(obj)
+                seqs.setdefault(group, []).append(obj)
         if not removed:
             counts = {}
             num_seqs = int(config['ARGS']['number']) # configparser uses ALL strings
             for obj in self._sp_object.return_ordered_seqs():
                 group = obj._group
-                try:
-                    counts[group] += 1
-                    count = counts[group]
-                except KeyError:
-                    count = 1 # first time
-                    counts[group] = count
+                count = counts.get(group, 0) + 1
+                counts[group] = count
                 if count <= num_seqs:
-                    try:
-                        seqs[group].append(obj)
-                    except KeyError:
-                        seqs[group] = []
-                        seqs[group].append(obj)
+                    seqs.setdefault(group, []).append(obj)
         return [(group,objs) for group,objs in seqs.items()]
 
 
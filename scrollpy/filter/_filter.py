@@ -75,11 +75,7 @@ class Filter:
         if self._group_lengths_ok(group):
             obj = self._indices[index][1]
             # Add to 'removed'
-            try:
-                self._removed[group].append(obj)
-            except KeyError:
-                self._removed[group] = []
-                self._removed[group].append(obj)
+            self._removed.setdefault(group, []).append(obj)
             # Delete from all other internals
             for l in (self._indices,self._lengths):
                 del l[index]
@@ -76,6 +76,7 @@ class ScrollPy:
         self._seq_dict = {}
         self._ordered_seqs = []
         self._groups = []
+        self._group_names = set()  # same names as _groups, for lookups
         self._group_counter = 1  # (possibly unused) counter for group IDs
         self._removed = {}       # dict of ScrollSeq objects removed
         self._id_counter = 1     # counter for creating unique sequence ids
@@ -150,7 +151,7 @@ class ScrollPy:
             modifies internal _seq_dict and _groups variables
         """
         for file_path in self.infiles:
-            group = os.path.basename(file_path).split('.',1)[0]
+            group = os.path.basename(file_path).partition('.')[0]
             if not len(group) > 0: # This should never happen in reality
                 group = str(self._group_counter)
                 self._group_counter += 1
@@ -169,29 +170,36 @@ class ScrollPy:
                     records,
                     )
             # Update internal objects
-            self._groups.append(group)
+            self._add_group(group)
             self._seq_dict[group] = scroll_seqs
 
 
-    def _unique_group_name(self, group, counter=0):
+    def _add_group(self, group):
+        """Adds a group name to both _groups and the set of used names"""
+        self._groups.append(group)
+        self._group_names.add(group)
+
+
+    def _unique_group_name(self, group):
         """Utility function to ensure group names are unique.
 
+        Repeated names are given the next free numeric suffix, i.e.
+        <group>, <group>.1, <group>.2, etc.
+
         Args:
             group (str): group name
 
         Returns:
             unique group name
         """
-        if group not in self._groups:
+        if group not in self._group_names:
             return group
-        else:
-            if counter == 1: # First time, add
-                group = group + '.' + str(counter)
-            if counter > 1:
-                group_basename = group.split('.',1)[0] # In case it is an int
-                group = group_basename + '.' + str(counter) # <group>.<num>
-            counter += 1
-            return self._unique_group_name(group, counter)
+        suffix = 1
+        new_group = group + '.1'  # <group>.<num>
+        while new_group in self._group_names:  # Could be a real group name
+            suffix += 1
+            new_group = group + '.' + str(suffix)
+        return new_group
 
 
     def _make_scroll_seqs(self, infile, group, records):
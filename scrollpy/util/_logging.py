@@ -335,6 +335,13 @@ class ConsoleFilter(GenericFilter):
                 header=header).fill(new_msg))
 
 
+    def _get_text_wrapper(self, width=None, header='ScrollPy: '):
+        """Pads subsequent lines to line up with the text after the header"""
+        wrapper = GenericFilter._get_text_wrapper(self, width, header)
+        wrapper.subsequent_indent = ' ' * len(header)
+        return wrapper
+
+
     def _add_header(self, level, string):
         """Adds a header to a string"""
         if level == 'INFO':
@@ -343,8 +350,8 @@ class ConsoleFilter(GenericFilter):
             header = 'ScrollPy [WARNING]: '
         elif level == 'ERROR':  # But no exception info
             header = 'ScrollPy [ERROR]: '
-        # Add header in front
-        formatted = ' '.join((header, string))
+        # Add header in front; header already ends in a space
+        formatted = header + string
         return (header,formatted)
 
 
@@ -95,8 +95,8 @@ def get_nonredundant_filepath(dir_path, filename, suffix=1):
         if suffix == 1:  # First time through
             _filename = filename + '.' + str(suffix)
         else:
-            _filename = filename.split('.',1)[0]  # May be other periods
-            _filename = filename + '.' + str(suffix)
+            _filename = filename.rsplit('.',1)[0]  # Drop last suffix only
+            _filename = _filename + '.' + str(suffix)
         suffix += 1
         return get_nonredundant_filepath(dir_path, _filename, suffix)  # Recur
 
@@ -147,7 +147,7 @@ def non_blank_lines(file_handle):
     """
     with open(file_handle,'r') as i:
         for line in i:
-            if line: # blank lines are not truthy
+            if line.strip(): # blank lines still hold '\n'
                 yield line
 
 
@@ -0,0 +1,18 @@
+"""
+Shared paths and fixture helpers for test modules.
+"""
+
+import os
+import functools
+
+from scrollpy.files import sequence_file
+
+# Resolved once, no matter how many test modules import it
+DATA_DIR = os.path.realpath(
+        os.path.join(os.path.dirname(__file__), 'fixtures')) # /tests/fixtures/
+
+
+@functools.lru_cache(maxsize=None)
+def cached_records(path):
+    """Parses a fixture file once; returns a tuple so it can't be altered"""
+    return tuple(sequence_file._get_sequences(path))
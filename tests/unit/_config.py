@@ -0,0 +1,30 @@
+"""
+Shared config setup for unit tests that need populated config values.
+
+Test modules import setup_test_config as their setUpModule.
+"""
+
+from scrollpy import config
+
+
+_loaded = False
+
+
+def setup_test_config():
+    """Populates program and ARGS values once per test run"""
+    global _loaded
+    if _loaded:
+        return
+    # Set here rather than read from the user's own config file; the
+    # commands are the same ones the alignment and distance tests call
+    config.read_dict({
+        'ALIGNMENT': {'Mafft': 'mafft-linsi'},
+        'DISTANCE': {'RAxML': 'raxmlHPC-PTHREADS-AVX'},
+        })
+    config.read_dict({'ARGS': {
+        'filter': 'False',
+        'filter_method': 'zscore',
+        'dist_matrix': 'LG',
+        'no_clobber': 'True',
+        }})
+    _loaded = True
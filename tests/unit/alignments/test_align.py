@@ -7,21 +7,21 @@ attribute of the BioPython AlignIO object.
 """
 
 import os, unittest, shutil
+import tempfile
 
 from Bio import AlignIO
 
 from scrollpy.alignments import align
+from tests._paths import DATA_DIR as data_dir
 
-cur_dir = os.path.dirname(os.path.realpath(__file__)) # /files/
-data_dir = os.path.join(cur_dir, '../../fixtures') # /tests/
 
 class TestAlignment(unittest.TestCase):
     """Tests each alignment using an example file"""
 
     def setUp(self):
-        """Makes a temporary directory in 'tests/fixtures'"""
-        self.tmpdir = os.path.join(data_dir, 'tmp-align')
-        os.makedirs(self.tmpdir)
+        """Makes a unique temporary directory"""
+        self.tmpdir = tempfile.mkdtemp(prefix='tmp-align_')
+        self.addCleanup(shutil.rmtree, self.tmpdir, ignore_errors=True)
         # Always use the same input file
         self.inpath = os.path.join(data_dir, 'Hsap_AP_EGADEZ.fa')
 
@@ -37,10 +37,6 @@ class TestAlignment(unittest.TestCase):
             test_alignment = AlignIO.read(i, "fasta")
         self.assertTrue(len(test_alignment) > 0)
 
-    def tearDown(self):
-        """Remove the directory"""
-        shutil.rmtree(self.tmpdir)
-
 
 if __name__ == '__main__':
     unittest.main()
@@ -3,20 +3,19 @@ This module contains test code for distance.py
 """
 
 import os, unittest, shutil
+import tempfile
 
 from scrollpy.distances import distance
-
-cur_dir = os.path.dirname(os.path.realpath(__file__)) # /files/
-data_dir = os.path.join(cur_dir, '../../fixtures') # /tests/
+from tests._paths import DATA_DIR as data_dir
 
 
 class TestDistance(unittest.TestCase):
     """Tests each distance method using an example file"""
 
     def setUp(self):
-        """Makes a temporary directory in 'tests/fixtures'"""
-        self.tmpdir = os.path.join(data_dir, 'tmp-dist')
-        os.makedirs(self.tmpdir)
+        """Makes a unique temporary directory"""
+        self.tmpdir = tempfile.mkdtemp(prefix='tmp-dist_')
+        self.addCleanup(shutil.rmtree, self.tmpdir, ignore_errors=True)
         # Always use the same input file (ALIGNED!)
         self.inpath = os.path.join(data_dir, 'Hsap_AP_EGADEZ.mfa')
 
@@ -38,10 +37,6 @@ class TestDistance(unittest.TestCase):
         final_out = os.path.join(self.tmpdir, out_file)
         self.assertTrue(os.stat(final_out).st_size > 0)
 
-    def tearDown(self):
-        """Remove the directory"""
-        shutil.rmtree(self.tmpdir)
-
 
 if __name__ == '__main__':
     unittest.main()
@@ -5,9 +5,7 @@ Tests functions found in the /distances/parser.py module.
 import os, unittest
 
 from scrollpy.distances import parser
-
-cur_dir = os.path.dirname(os.path.realpath(__file__)) # /files/
-data_dir = os.path.join(cur_dir, '../../fixtures') # /tests/
+from tests._paths import DATA_DIR as data_dir
 
 
 class TestParser(unittest.TestCase):
@@ -4,18 +4,14 @@ Tests classes in the 'output.py' module.
 
 import os
 import shutil
+import tempfile
 import unittest
-from configparser import DuplicateSectionError
 
 from scrollpy.files import output
 from scrollpy import config
-from scrollpy import load_config_file
 from scrollpy.scrollsaw._scrollpy import ScrollPy
-
-
-cur_dir = os.path.dirname(os.path.realpath(__file__)) # /files/
-# cleaner to use realpath due to relative path
-data_dir = os.path.realpath(os.path.join(cur_dir, '../../fixtures')) # /tests/
+from tests.unit._config import setup_test_config as setUpModule
+from tests._paths import DATA_DIR as data_dir
 
 
 class TestBaseWriter(unittest.TestCase):
@@ -39,33 +35,18 @@ class TestBaseWriter(unittest.TestCase):
 class TestSeqWriterOneFile(unittest.TestCase):
     """Tests the seq writer class"""
 
+    # CHANGE ME TO CHANGE TEST
+    #######################################
+    INFILE = 'Hsap_AP1G_FourSeqs.fa'      #
+    #######################################
+
     def setUp(self):
         """Create necessary objects"""
-        # Make dir
-        self.tmpdir = os.path.join(data_dir, 'out-seq')
-        try:
-            os.makedirs(self.tmpdir)
-        except FileExistsError:
-            print("Failed to make target directory")
-            pass
-        # Populate ARGS values of config file
-        load_config_file()
-        try:
-            config.add_section('ARGS')
-        except DuplicateSectionError:
-            pass
-        # Now provide sufficient arg defaults
-        config['ARGS']['filter'] = 'False'
-        config['ARGS']['filter_method'] = 'zscore'
-        config['ARGS']['dist_matrix'] = 'LG'
-        config['ARGS']['no_clobber'] = 'True'
+        self.tmpdir = tempfile.mkdtemp(prefix='out-seq_')
+        # Runs even if the rest of setUp raises, unlike tearDown
+        self.addCleanup(shutil.rmtree, self.tmpdir, ignore_errors=True)
         # Make ScrollPy object
-        # CHANGE ME TO CHANGE TEST
-        #######################################
-        self.infile = 'Hsap_AP1G_FourSeqs.fa' #
-        #######################################
-        self.infile_base = self.infile.split('.')[0]
-        self.inpath = os.path.join(data_dir, self.infile)
+        self.inpath = os.path.join(data_dir, self.INFILE)
         self.sp = ScrollPy(
                 self.tmpdir, #target dir
                 'Mafft', # align_method
@@ -83,11 +64,7 @@ class TestSeqWriterOneFile(unittest.TestCase):
     def test_filter_equal(self):
         """Tests whether _filter returns the original seq list"""
         # Mock user input
-        try:
-            config.add_section('ARGS')
-        except DuplicateSectionError:
-            pass
-        config.set('ARGS', 'number', '4') # i.e. config['ARGS']['number']
+        config.read_dict({'ARGS': {'number': '4'}})
         # Test list
         new_list = self.writer._filter()
         self.assertEqual(len(new_list[0][1]), 4) # nested -> [(x,[])]
@@ -96,11 +73,7 @@ class TestSeqWriterOneFile(unittest.TestCase):
     def test_filter_less(self):
         """Tests whether _filter returns a smaller list"""
         # Mock user input
-        try:
-            config.add_section('ARGS')
-        except DuplicateSectionError:
-            pass
-        config.set('ARGS', 'number', '2') # i.e. config['ARGS']['number']
+        config.read_dict({'ARGS': {'number': '2'}})
         # Test list
         new_list = self.writer._filter()
         self.assertEqual(len(new_list[0][1]), 2) # nested -> [(x,[])]
@@ -109,11 +82,7 @@ class TestSeqWriterOneFile(unittest.TestCase):
     def test_filter_more(self):
         """Tests whether _filter handles N larger than actual number"""
         # Mock user input
-        try:
-            config.add_section('ARGS')
-        except DuplicateSectionError:
-            pass
-        config.set('ARGS', 'number', '6') # i.e. config['ARGS']['number']
+        config.read_dict({'ARGS': {'number': '6'}})
         # Test list
         new_list = self.writer._filter()
         self.assertEqual(len(new_list[0][1]), 4) # nested -> [(x,[])]
@@ -122,43 +91,36 @@ class TestSeqWriterOneFile(unittest.TestCase):
     def test_get_filepath(self):
         """Tests returned filepath"""
         # Mock user input
-        try:
-            config.add_section('ARGS')
-        except DuplicateSectionError:
-            pass
-        config.set('ARGS', 'no-clobber', 'False')
-        config.set('ARGS', 'filesep', '_')
-        config.set('ARGS', 'suffix', 'awesome')
-        config.set('ARGS', 'seqfmt', 'fasta')
+        config.read_dict({'ARGS': {
+            'no-clobber': 'False',
+            'filesep': '_',
+            'suffix': 'awesome',
+            'seqfmt': 'fasta',
+            }})
         # Call and test
         outpath = self.writer._get_filepath("group")
         self.assertEqual(outpath,
                 os.path.join(self.tmpdir, 'group_sequences_awesome.fa'))
 
 
-    def tearDown(self):
-        """Removes the directory"""
-        shutil.rmtree(self.tmpdir)
-
-
 class TestTableWriter(unittest.TestCase):
     """Tests the TableWriter subclass"""
 
+    # CHANGE ME TO CHANGE TEST
+    #######################################
+    INFILE = 'Hsap_AP1G_FourSeqs.fa'      #
+    #######################################
+
+    @classmethod
+    def setUpClass(cls):
+        """Makes one dir; no test writes into it"""
+        cls.tmpdir = tempfile.mkdtemp(prefix='out-table_')
+
+
     def setUp(self):
         """Create necessary objects"""
-        # Make dir
-        self.tmpdir = os.path.join(data_dir, 'out-table')
-        try:
-            os.makedirs(self.tmpdir)
-        except FileExistsError:
-            pass
         # Make ScrollPy object
-        # CHANGE ME TO CHANGE TEST
-        #######################################
-        self.infile = 'Hsap_AP1G_FourSeqs.fa' #
-        #######################################
-        self.infile_base = self.infile.split('.')[0]
-        self.inpath = os.path.join(data_dir, self.infile)
+        self.inpath = os.path.join(data_dir, self.INFILE)
         self.sp = ScrollPy(
                 self.tmpdir, #target dir
                 'Mafft', # align_method
@@ -209,9 +171,10 @@ class TestTableWriter(unittest.TestCase):
                 ["_", "one_sep", "two__seps", "one _ sep"])
 
 
-    def tearDown(self):
+    @classmethod
+    def tearDownClass(cls):
         """Removes the directory"""
-        shutil.rmtree(self.tmpdir)
+        shutil.rmtree(cls.tmpdir, ignore_errors=True)
 
 
 if __name__ == '__main__':
@@ -3,15 +3,14 @@ Module for testing 'sequence_file.py' classes/functions.
 """
 
 import os, unittest, shutil
+import tempfile
 
 from Bio import SeqIO
 
 from scrollpy.sequences._scrollseq import ScrollSeq
 from scrollpy.files import sequence_file
-
-# Relative path access to test data
-cur_dir = os.path.dirname(os.path.realpath(__file__)) # /files/
-data_dir = os.path.join(cur_dir, '../../fixtures/') #/tests/fixtures/
+from tests._paths import DATA_DIR as data_dir
+from tests._paths import cached_records
 
 
 class TestSequenceParsing(unittest.TestCase):
@@ -37,8 +36,8 @@ class TestSequenceConcatenation(unittest.TestCase):
         """Tests combining two non-zero lists"""
         one_seq_file = os.path.join(data_dir,'Hsap_AP1G_OneSeq.fa')
         four_seqs_file = os.path.join(data_dir,'Hsap_AP1G_FourSeqs.fa')
-        one_record = sequence_file._get_sequences(one_seq_file)
-        four_records = sequence_file._get_sequences(four_seqs_file)
+        one_record = cached_records(one_seq_file)
+        four_records = cached_records(four_seqs_file)
         self.assertEqual(len(sequence_file._cat_sequence_lists(
             one_record, four_records)), 5)
 
@@ -47,18 +46,13 @@ class TestSequenceWriting(unittest.TestCase):
     """Tests '_sequence_list_to_file' function"""
 
     def setUp(self):
-        """Makes a temporary directory in 'tests/fixtures'"""
-        self.tmpdir = os.path.join(data_dir, 'tmp')
-        try:
-            os.makedirs(self.tmpdir)
-        except FileExistsError:
-            pass # already made
+        """Makes a unique temporary directory"""
+        self.tmpdir = tempfile.mkdtemp(prefix='seqfile_')
+        self.addCleanup(shutil.rmtree, self.tmpdir, ignore_errors=True)
         self.one_seq_file = os.path.join(data_dir,'Hsap_AP1G_OneSeq.fa')
         self.four_seqs_file = os.path.join(data_dir,'Hsap_AP1G_FourSeqs.fa')
-        self.one_record = sequence_file._get_sequences(
-                self.one_seq_file)
-        self.four_records = sequence_file._get_sequences(
-                self.four_seqs_file)
+        self.one_record = cached_records(self.one_seq_file)
+        self.four_records = cached_records(self.four_seqs_file)
         self.cat_list = sequence_file._cat_sequence_lists(
                 self.one_record,
                 self.four_records)
@@ -107,10 +101,6 @@ class TestSequenceWriting(unittest.TestCase):
             "fasta")]
         self.assertEqual(len(new_records), 5)
 
-    def tearDown(self):
-        """Removes the directory"""
-        shutil.rmtree(self.tmpdir)
-
 
 if __name__ == '__main__':
     unittest.main()
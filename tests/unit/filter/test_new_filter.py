@@ -12,13 +12,12 @@ from numpy import mean,median,std
 from numpy import append as np_append
 from numpy.random import seed,randn
 
-from scrollpy.config._config import config,load_config_file
 from scrollpy.filter._new_filter import Filter,LengthFilter,IdentityFilter
+from tests.unit._config import setup_test_config as setUpModule
 
 
 cur_dir = os.path.dirname(os.path.realpath(__file__))
 data_dir = os.path.realpath(os.path.join(cur_dir, '../../fixtures'))
-load_config_file()
 
 ####################################
 # Global mock objects for ScrollSeq #
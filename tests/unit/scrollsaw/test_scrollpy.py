@@ -3,50 +3,43 @@ Module containging test code for the main ScrollPy object.
 """
 
 import os, unittest, shutil
-from configparser import DuplicateSectionError
+import tempfile
 
 from Bio import SeqIO
 
-from scrollpy import config
-from scrollpy import load_config_file
 from scrollpy.scrollsaw._scrollpy import ScrollPy
+from tests.unit._config import setup_test_config as setUpModule
+from tests._paths import DATA_DIR as data_dir
 
 
-cur_dir = os.path.dirname(os.path.realpath(__file__)) # /files/
-# cleaner to use realpath due to relative path
-data_dir = os.path.realpath(os.path.join(cur_dir, '../../fixtures')) # /tests/
+def _clear_dir(dir_path):
+    """Removes everything inside a directory, but not the directory itself"""
+    for entry in os.scandir(dir_path):
+        if entry.is_dir(follow_symlinks=False):
+            shutil.rmtree(entry.path)
+        else:
+            os.unlink(entry.path)
 
 
 class TestScrollPyOneFile(unittest.TestCase):
     """Tests generic methods that don't invoke any downstream calls"""
 
+    # CHANGE ME TO CHANGE TEST
+    #######################################
+    INFILE = 'Hsap_AP1G_FourSeqs.fa'      #
+    #######################################
+    INFILE_BASE = INFILE.partition('.')[0]
+
+    @classmethod
+    def setUpClass(cls):
+        """Makes a single tmp dir for all tests"""
+        cls.tmpdir = tempfile.mkdtemp(prefix='ss-tmp_')
+        cls.addClassCleanup(shutil.rmtree, cls.tmpdir, ignore_errors=True)
+        cls.inpath = os.path.join(data_dir, cls.INFILE)
+
+
     def setUp(self):
         """Creates a new ScrollPy Object"""
-        self.tmpdir = os.path.join(data_dir, 'ss-tmp')
-        try:
-            os.makedirs(self.tmpdir)
-        except FileExistsError:
-            pass
-        # Populate ARGS values of config file
-        load_config_file()
-        try:
-            config.add_section('ARGS')
-        except DuplicateSectionError:
-            pass
-        # Now provide sufficient arg defaults
-        config['ARGS']['filter'] = 'False'
-        config['ARGS']['filter_method'] = 'zscore'
-        config['ARGS']['dist_matrix'] = 'LG'
-        config['ARGS']['no_clobber'] = 'True'
-
-        # CHANGE ME TO CHANGE TEST
-        #######################################
-        self.infile = 'Hsap_AP1G_FourSeqs.fa' #
-        #######################################
-
-        self.infile_base = self.infile.split('.')[0]
-        self.inpath = os.path.join(data_dir, self.infile)
-
         self.sp = ScrollPy(
                 self.tmpdir, # target_dir
                 'Mafft', # align_method
@@ -58,43 +51,62 @@ class TestScrollPyOneFile(unittest.TestCase):
     # Testing Utility function(s)
     def test_group_naming_nonoverlap(self):
         """Tests to ensure that naming is normal if unique"""
-        self.sp._groups.append("group1")
-        self.sp._groups.append(
+        self.sp._add_group("group1")
+        self.sp._add_group(
             self.sp._unique_group_name("group2"))
         self.assertEqual(self.sp._groups, ["group1", "group2"])
 
 
     def test_group_naming_overlap(self):
         """Tests that the group naming convention works"""
-        self.sp._groups.append("group1")
-        self.sp._groups.append(
+        self.sp._add_group("group1")
+        self.sp._add_group(
             self.sp._unique_group_name("group1"))
         self.assertEqual(self.sp._groups, ["group1", "group1.1"])
 
 
     def test_group_naming_overlap_integers(self):
         """Tests that group naming works if names are ints"""
-        self.sp._groups.append("1") # These should always be strings
-        self.sp._groups.append(
+        self.sp._add_group("1") # These should always be strings
+        self.sp._add_group(
             self.sp._unique_group_name("1")) # Always strings!
         self.assertEqual(self.sp._groups, ["1", "1.1"])
 
 
     def test_group_naming_overlap_floats(self):
         """Tests that group naming works if names are float-ish"""
-        self.sp._groups.append("1.1")
-        self.sp._groups.append(
+        self.sp._add_group("1.1")
+        self.sp._add_group(
             self.sp._unique_group_name("1.1")) # Always strings
         self.assertEqual(self.sp._groups, ["1.1", "1.1.1"])
 
 
+    def test_group_naming_repeated(self):
+        """Tests that repeated names get increasing suffixes"""
+        for group in ("group1", "1.1"):
+            with self.subTest(group=group):
+                sp = ScrollPy(self.tmpdir, 'Mafft', 'RAxML', (self.inpath,))
+                sp._add_group(group)
+                for _ in range(3):
+                    sp._add_group(sp._unique_group_name(group))
+                self.assertEqual(sp._groups, [group,
+                    group + ".1", group + ".2", group + ".3"])
+
+
+    def test_group_naming_taken_suffix(self):
+        """Tests that a suffix already used by a real group is skipped"""
+        self.sp._add_group("group1")
+        self.sp._add_group("group1.1")
+        self.assertEqual(self.sp._unique_group_name("group1"), "group1.2")
+
+
     # Testing actual data-based functions
     def test_infile_parsing(self):
         """Tests that infile parsing is fine"""
         self.sp._parse_infiles()
-        self.assertEqual(self.sp._groups[0], self.infile_base)
-        self.assertTrue(self.infile_base in self.sp._seq_dict.keys())
-        self.assertEqual(len(self.sp._seq_dict[self.infile_base]), 4)
+        self.assertEqual(self.sp._groups[0], self.INFILE_BASE)
+        self.assertTrue(self.INFILE_BASE in self.sp._seq_dict.keys())
+        self.assertEqual(len(self.sp._seq_dict[self.INFILE_BASE]), 4)
 
 
     def test_make_scroll_seqs(self):
@@ -114,7 +126,7 @@ class TestScrollPyOneFile(unittest.TestCase):
         """Tests that collection are made ok"""
         with open(self.sp.infiles[0]) as i:
             records = [r for r in SeqIO.parse(i, "fasta")]
-        self.sp._groups.append("one") # need to have _groups
+        self.sp._add_group("one") # need to have _groups
         self.sp._seq_dict["one"] = records
         self.sp._make_scroll_seqs(
             self.sp.infiles[0],
@@ -127,7 +139,7 @@ class TestScrollPyOneFile(unittest.TestCase):
     def test_sort_distances_in_order(self):
         """Tests sorting when objects are already in order"""
         self.sp._parse_infiles() # Should populate all groups
-        scroll_seq_objs = self.sp._seq_dict[self.infile_base]
+        scroll_seq_objs = self.sp._seq_dict[self.INFILE_BASE]
         dist = 0
         for obj in scroll_seq_objs:
             obj += dist
@@ -141,7 +153,7 @@ class TestScrollPyOneFile(unittest.TestCase):
     def test_sort_distances_outof_order(self):
         """Tests sorting when objects are not already in order"""
         self.sp._parse_infiles() # Should populate all groups
-        scroll_seq_objs = self.sp._seq_dict[self.infile_base]
+        scroll_seq_objs = self.sp._seq_dict[self.INFILE_BASE]
         for _,d in zip(scroll_seq_objs, (3,1,4,2)):
             _ += d
         self.sp._sort_distances() # changes sp._ordered_seqs
@@ -162,33 +174,32 @@ class TestScrollPyOneFile(unittest.TestCase):
 
 
     def tearDown(self):
-        """Remove tmp dir and all files"""
-        shutil.rmtree(self.tmpdir)
+        """Empty the tmp dir for the next test"""
+        _clear_dir(self.tmpdir)
 
 
 class TestScrollPyTwoFiles(unittest.TestCase):
     """Tests each individual method with two files"""
 
-    def setUp(self):
-        """Creates a new ScrollPy Object"""
-        self.tmpdir = os.path.join(data_dir, 'ss-tmp2')
-        try:
-            os.makedirs(self.tmpdir)
-        except FileExistsError:
-            pass
-
-        # CHANGE ME TO CHANGE TEST
-        ########################################
-        self.infile1 = 'Hsap_AP1G_FourSeqs.fa' #
-        self.infile2 = 'Tgon_AP1_FourSeqs.fa'  #
-        ########################################
+    # CHANGE ME TO CHANGE TEST
+    ########################################
+    INFILE1 = 'Hsap_AP1G_FourSeqs.fa'      #
+    INFILE2 = 'Tgon_AP1_FourSeqs.fa'       #
+    ########################################
+    INFILE1_BASE = INFILE1.partition('.')[0]
+    INFILE2_BASE = INFILE2.partition('.')[0]
 
-        self.infile1_base = self.infile1.split('.',1)[0]
-        self.inpath1 = os.path.join(data_dir, self.infile1)
+    @classmethod
+    def setUpClass(cls):
+        """Makes a single tmp dir for all tests"""
+        cls.tmpdir = tempfile.mkdtemp(prefix='ss-tmp2_')
+        cls.addClassCleanup(shutil.rmtree, cls.tmpdir, ignore_errors=True)
+        cls.inpath1 = os.path.join(data_dir, cls.INFILE1)
+        cls.inpath2 = os.path.join(data_dir, cls.INFILE2)
 
-        self.infile2_base = self.infile2.split('.',1)[0]
-        self.inpath2 = os.path.join(data_dir, self.infile2)
 
+    def setUp(self):
+        """Creates a new ScrollPy Object"""
         self.sp = ScrollPy(
                 self.tmpdir, # target_dir
                 'Mafft', # align_method
@@ -201,9 +212,9 @@ class TestScrollPyTwoFiles(unittest.TestCase):
         """Tests that the infiles are correctly parsed"""
         self.sp._parse_infiles()
         self.assertEqual(self.sp._groups,
-            [self.infile1_base, self.infile2_base])
-        file1_ids = [o.id_num for o in self.sp._seq_dict[self.infile1_base]]
-        file2_ids = [o.id_num for o in self.sp._seq_dict[self.infile2_base]]
+            [self.INFILE1_BASE, self.INFILE2_BASE])
+        file1_ids = [o.id_num for o in self.sp._seq_dict[self.INFILE1_BASE]]
+        file2_ids = [o.id_num for o in self.sp._seq_dict[self.INFILE2_BASE]]
         self.assertEqual(file1_ids, [1,2,3,4])
         self.assertEqual(file2_ids, [5,6,7,8])
 
@@ -215,37 +226,35 @@ class TestScrollPyTwoFiles(unittest.TestCase):
 
 
     def tearDown(self):
-        """Remove tmp dir and all files"""
-        shutil.rmtree(self.tmpdir)
+        """Empty the tmp dir for the next test"""
+        _clear_dir(self.tmpdir)
 
 
 class TestScrollPyThreeFiles(unittest.TestCase):
     """Tests each individual method with three files"""
 
-    def setUp(self):
-        """Creates a new ScrollPy Object"""
-        self.tmpdir = os.path.join(data_dir, 'ss-tmp3')
-        try:
-            os.makedirs(self.tmpdir)
-        except FileExistsError:
-            pass
-
-        # CHANGE ME TO CHANGE TEST
-        ########################################
-        self.infile1 = 'Hsap_AP1G_FourSeqs.fa' #
-        self.infile2 = 'Tgon_AP1_FourSeqs.fa'  #
-        self.infile3 = 'Ngru_AP1_FourSeqs.fa'  #
-        ########################################
+    # CHANGE ME TO CHANGE TEST
+    ########################################
+    INFILE1 = 'Hsap_AP1G_FourSeqs.fa'      #
+    INFILE2 = 'Tgon_AP1_FourSeqs.fa'       #
+    INFILE3 = 'Ngru_AP1_FourSeqs.fa'       #
+    ########################################
+    INFILE1_BASE = INFILE1.partition('.')[0]
+    INFILE2_BASE = INFILE2.partition('.')[0]
+    INFILE3_BASE = INFILE3.partition('.')[0]
+
+    @classmethod
+    def setUpClass(cls):
+        """Makes a single tmp dir for all tests"""
+        cls.tmpdir = tempfile.mkdtemp(prefix='ss-tmp3_')
+        cls.addClassCleanup(shutil.rmtree, cls.tmpdir, ignore_errors=True)
+        cls.inpath1 = os.path.join(data_dir, cls.INFILE1)
+        cls.inpath2 = os.path.join(data_dir, cls.INFILE2)
+        cls.inpath3 = os.path.join(data_dir, cls.INFILE3)
 
-        self.infile1_base = self.infile1.split('.',1)[0]
-        self.inpath1 = os.path.join(data_dir, self.infile1)
-
-        self.infile2_base = self.infile2.split('.',1)[0]
-        self.inpath2 = os.path.join(data_dir, self.infile2)
-
-        self.infile3_base = self.infile3.split('.',1)[0]
-        self.inpath3 = os.path.join(data_dir, self.infile3)
 
+    def setUp(self):
+        """Creates a new ScrollPy Object"""
         self.sp = ScrollPy(
                 self.tmpdir, # target_dir
                 'Mafft', # align_method
@@ -261,13 +270,13 @@ class TestScrollPyThreeFiles(unittest.TestCase):
         """Tests that the infiles are correctly parsed"""
         self.sp._parse_infiles()
         self.assertEqual(self.sp._groups,
-            [self.infile1_base,
-            self.infile2_base,
-            self.infile3_base,
+            [self.INFILE1_BASE,
+            self.INFILE2_BASE,
+            self.INFILE3_BASE,
             ])
-        file1_ids = [o.id_num for o in self.sp._seq_dict[self.infile1_base]]
-        file2_ids = [o.id_num for o in self.sp._seq_dict[self.infile2_base]]
-        file3_ids = [o.id_num for o in self.sp._seq_dict[self.infile3_base]]
+        file1_ids = [o.id_num for o in self.sp._seq_dict[self.INFILE1_BASE]]
+        file2_ids = [o.id_num for o in self.sp._seq_dict[self.INFILE2_BASE]]
+        file3_ids = [o.id_num for o in self.sp._seq_dict[self.INFILE3_BASE]]
         self.assertEqual(file1_ids, [1,2,3,4])
         self.assertEqual(file2_ids, [5,6,7,8])
         self.assertEqual(file3_ids, [9,10,11,12])
@@ -280,6 +289,5 @@ class TestScrollPyThreeFiles(unittest.TestCase):
 
 
     def tearDown(self):
-        """Remove tmp dir and all files"""
-        shutil.rmtree(self.tmpdir)
-
+        """Empty the tmp dir for the next test"""
+        _clear_dir(self.tmpdir)
@@ -3,52 +3,53 @@ Tests /sequences/_collection.py
 """
 
 import os, unittest, shutil
-from configparser import DuplicateSectionError
+import copy
+import tempfile
+from unittest.mock import MagicMock
 
-from scrollpy import config
-from scrollpy import load_config_file
 from scrollpy.sequences._scrollseq import ScrollSeq
 from scrollpy.sequences._collection import ScrollCollection
-from scrollpy.files import sequence_file as sf
-
-cur_dir = os.path.dirname(os.path.realpath(__file__)) # /files/
-# cleaner to use realpath due to relative path
-data_dir = os.path.realpath(os.path.join(cur_dir, '../../fixtures')) # /tests/
+from tests.unit._config import setup_test_config as setUpModule
+from tests._paths import DATA_DIR as data_dir
+from tests._paths import cached_records
 
 
 class TestScrollCollection(unittest.TestCase):
     """Tests each individual method"""
 
-    def setUp(self):
-        """Creates a new ScrollCollection Object"""
-        # Populate ARGS values of config file
-        load_config_file()
-        try:
-            config.add_section('ARGS')
-        except DuplicateSectionError:
-            pass
-        # Now provide sufficient arg defaults
-        config['ARGS']['filter'] = 'False'
-        config['ARGS']['filter_method'] = 'zscore'
-        config['ARGS']['dist_matrix'] = 'LG'
-        config['ARGS']['no_clobber'] = 'True'
+    # Output file name for each out_type, for a collection of group 'one'
+    EXPECTED_OUTFILES = {
+            'seqs' : 'one.fa',
+            'align' : 'one.mfa',
+            'distance' : 'one',
+            }
 
-
-        ids = (1,2,3,4)
-        infile = os.path.join(data_dir, 'Hsap_AP1G_FourSeqs.fa')
-        records = sf._get_sequences(infile)
-        self.seq_list = []
-        for id_num, seq_record in zip(ids, records):
-            self.seq_list.append(ScrollSeq(
+    @classmethod
+    def setUpClass(cls):
+        """Parses the input file and makes ScrollSeq objects once"""
+        cls._class_tmp = tempfile.mkdtemp(prefix='collection_')
+        # Runs even if the rest of setUpClass raises
+        cls.addClassCleanup(shutil.rmtree, cls._class_tmp, ignore_errors=True)
+        cls.ids = (1,2,3,4)
+        cls.infile = os.path.join(data_dir, 'Hsap_AP1G_FourSeqs.fa')
+        records = cached_records(cls.infile)
+        cls.seq_list_template = []
+        for id_num, seq_record in zip(cls.ids, records):
+            cls.seq_list_template.append(ScrollSeq(
                 id_num, # ID
-                infile, # infile
+                cls.infile, # infile
                 id_num, # Group; not important here
                 SeqRecord = seq_record))
-        self.tmpdir = os.path.join(data_dir, 'tmp')
-        try:
-            os.makedirs(self.tmpdir)
-        except FileExistsError:
-            pass # tmpdir still present
+        # Spec'd mocks are only built once; reset before each use
+        cls._incr_mocks = [MagicMock(spec=ScrollSeq, id_num=i)
+                for i in (1,2,3)]
+
+    def setUp(self):
+        """Creates a new ScrollCollection Object"""
+        # Shallow copy; tests that modify ScrollSeq objects must deep copy
+        self.seq_list = list(self.seq_list_template)
+        # Each test writes into its own subdir of the class tmpdir
+        self.tmpdir = tempfile.mkdtemp(dir=self._class_tmp)
         self.collection = ScrollCollection(
                 self.tmpdir, # outdir
                 self.seq_list, # sequence list
@@ -57,6 +58,13 @@ class TestScrollCollection(unittest.TestCase):
                 'RAxML',# dist_method
                 )
 
+    def test_get_outpath(self):
+        """Tests outpath naming for each type of output file"""
+        for out_type, name in self.EXPECTED_OUTFILES.items():
+            with self.subTest(out_type=out_type):
+                self.assertEqual(self.collection._get_outpath(out_type),
+                    os.path.join(self.tmpdir, name))
+
     def test_file_creation(self):
         """Tests internal file creation method"""
         expected_file = os.path.join(self.tmpdir, 'one.fa')
@@ -86,11 +94,19 @@ class TestScrollCollection(unittest.TestCase):
         self.collection._parse_distances()
         self.assertTrue(len(self.collection._dist_dict.keys()) > 0)
 
+    def test_increment_seq_distances(self):
+        """Tests that each object gets the distance matching its ID"""
+        for mock_seq in self._incr_mocks:
+            mock_seq.reset_mock()
+        self.collection.seq_list = self._incr_mocks
+        self.collection._dist_dict = {'1':5, '2':6, '3':7}
+        self.collection._increment_seq_distances()
+        for mock_seq, dist in zip(self._incr_mocks, (5,6,7)):
+            mock_seq.__iadd__.assert_called_once_with(dist)
+
     def test_collection_call(self):
         """Tests that call properly executes all of the above"""
+        # Call increments ScrollSeq distances; don't touch shared objects
+        self.collection.seq_list = copy.deepcopy(self.seq_list_template)
         self.collection()
         self.assertTrue(len(self.collection._dist_dict.keys()) > 0)
-
-    def tearDown(self):
-        """Remove temporary directory"""
-        shutil.rmtree(self.tmpdir)
@@ -3,58 +3,72 @@ This module contains code for testing the ScrollSeq class.
 """
 
 import os, unittest
+import functools
+from types import SimpleNamespace
+from unittest.mock import Mock, call, patch
 
-from Bio import SeqIO
+from Bio.SeqIO.FastaIO import SimpleFastaParser
 
 from scrollpy.sequences import _scrollseq
+from tests._paths import DATA_DIR as data_dir
 
-cur_dir = os.path.dirname(os.path.realpath(__file__)) # /files/
-data_dir = os.path.join(cur_dir, '../../fixtures') # /tests/
+one_seq_file_path = os.path.join(data_dir, 'Hsap_AP1G_OneSeq.fa')
+
+
+@functools.lru_cache(maxsize=1)
+def _load_record():
+    """Parses the one-sequence fixture once per process"""
+    with open(one_seq_file_path, 'r') as i:
+        title, seq = next(SimpleFastaParser(i))
+    # Tests only need the SeqRecord attributes that ScrollSeq exposes
+    accession = title.split(None, 1)[0]
+    return SimpleNamespace(
+            id=accession,
+            name=accession,
+            description=title,
+            seq=seq)
+
+
+def _new_seq_object():
+    """Wraps the shared SeqRecord-like fixture in a new ScrollSeq object"""
+    # Tests only change the wrapper, never the record itself
+    return _scrollseq.ScrollSeq(
+            1, # ID
+            one_seq_file_path, # inpath
+            'one', # group
+            _load_record()) # SeqRecord
+
+
+# (start, stop) of each 80-character FASTA line of the 825-residue fixture
+_CHUNK_BOUNDS = tuple((i, i + 80) for i in range(0, 800, 80)) + ((800, 825),)
 
 
 class TestScrollSeq(unittest.TestCase):
     """Tests instance creation and attribute accesss"""
 
     def setUp(self):
-        """Parses a file to provide a single SeqRecord"""
-        one_seq_file_path = os.path.join(data_dir, 'Hsap_AP1G_OneSeq.fa')
-        with open(one_seq_file_path, 'r') as i:
-            self.SeqRecord = SeqIO.read(i, "fasta")
-        self.seq_object = _scrollseq.ScrollSeq(
-                1, # ID
-                one_seq_file_path, # inpath
-                'one', # group
-                self.SeqRecord) # SeqRecord
+        """Makes a new ScrollSeq object"""
+        self.seq_object = _new_seq_object()
 
     # Test incrementing distance
-    def test_iadd_float(self):
-        """Tests the _increment_distance method"""
-        self.seq_object += 2.0
-        self.assertEqual(self.seq_object._distance, 2.0)
-
-    def test_iadd_int(self):
-        """Tests the _increment_distance method"""
-        self.seq_object += 2
-        self.assertEqual(self.seq_object._distance, 2.0)
-
-    def test_iadd_goodstr(self):
-        """Tests the _incrememnt_distance method with number string"""
-        self.seq_object += '2'
-        self.assertEqual(self.seq_object._distance, 2.0)
-
-    def test_iadd_badstr(self):
-        """Tests the _increment_distance method with text string.
-        Should raise a ValueError when float casting
+    def test_iadd(self):
+        """Tests the _increment_distance method with valid values"""
+        for value in (2.0, 2, '2'):
+            with self.subTest(value=value):
+                seq_object = _new_seq_object()
+                seq_object += value
+                self.assertEqual(seq_object._distance, 2.0)
+
+    def test_iadd_invalid(self):
+        """Tests the _increment_distance method with invalid values.
+        Text strings fail float casting and negative values are not
+        allowed; both should raise a ValueError.
         """
-        with self.assertRaises(ValueError):
-            self.seq_object += 'two'
-
-    def test_iadd_negative(self):
-        """Tests the _incremenent_distance method with < 0.
-        Should raise a ValueError.
-        """
-        with self.assertRaises(ValueError):
-            self.seq_object += -1.0
+        for value in ('two', -1.0):
+            with self.subTest(value=value):
+                seq_object = _new_seq_object()
+                with self.assertRaises(ValueError):
+                    seq_object += value
 
     # Test accessing and altering accession (SeqRecord.id)
     def test_accession_access(self):
@@ -83,5 +97,33 @@ class TestScrollSeq(unittest.TestCase):
         with self.assertRaises(AttributeError):
             del self.seq_object.__dict__["_accession"]
 
+
+@patch('scrollpy.sequences._scrollseq.SeqIO.write', new_callable=Mock)
+class TestScrollSeqWrite(unittest.TestCase):
+    """Tests writing; SeqIO.write is patched for every test in the class"""
+
+    def setUp(self):
+        """Makes a new ScrollSeq object and a file-like mock"""
+        self.seq_object = _new_seq_object()
+        self.mock_fobj = Mock(spec_set=['write']) # Only a file-like write()
+
+    def test_write(self, mock_write):
+        """Tests that the record is handed to SeqIO in the given format"""
+        self.seq_object._write(self.mock_fobj, 'fasta')
+        mock_write.assert_called_once_with(
+                _load_record(), self.mock_fobj, 'fasta')
+
+    def test_write_by_id(self, mock_write):
+        """Tests that the header is the ID and the sequence is chunked"""
+        self.seq_object._write_by_id(self.mock_fobj)
+        seq = str(_load_record().seq)
+        expected = [call('>1\n')]
+        expected.extend(call(seq[start:stop] + '\n')
+                for start, stop in _CHUNK_BOUNDS)
+        # Whole list, so any extra or stray write() also fails
+        self.assertEqual(self.mock_fobj.write.mock_calls, expected)
+        mock_write.assert_not_called() # Uses its own formatter
+
+
 if __name__ == '__main__':
     unittest.main()
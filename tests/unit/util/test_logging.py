@@ -0,0 +1,223 @@
+"""
+Module containing test code for logging helpers in '_logging.py'.
+"""
+
+import sys
+import datetime
+import unittest
+from types import SimpleNamespace
+from unittest.mock import Mock, call
+
+from scrollpy.util import _logging as scroll_log
+
+
+# (header, header + message) returned by ConsoleFilter._add_header()
+ADD_HEADER_EXPECTED = {
+        'INFO' : ('ScrollPy: ', 'ScrollPy: A message.'),
+        'WARNING' : ('ScrollPy [WARNING]: ', 'ScrollPy [WARNING]: A message.'),
+        'ERROR' : ('ScrollPy [ERROR]: ', 'ScrollPy [ERROR]: A message.'),
+        }
+
+
+# Logger methods called by log_message(), plus identifying attributes
+LOGGER_SPEC = ('debug', 'info', 'warning', 'error', 'exception',
+        'handlers', 'name')
+
+
+def fake_logger(name=''):
+    """Returns a cheap, spec'd stand-in for a logging.Logger"""
+    # Copies of one Mock share child mocks, so always build a new one
+    logger = Mock(spec_set=LOGGER_SPEC)
+    logger.name = name
+    logger.handlers = []
+    return logger
+
+
+class TestStandAloneFunctions(unittest.TestCase):
+    """Tests module-level functions"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Makes the shared, read-only message object once"""
+        cls.msg = scroll_log.BraceMessage("A message")
+
+    def setUp(self):
+        """Makes two fresh logger stand-ins"""
+        self.l1 = fake_logger('logger1')
+        self.l2 = fake_logger('logger2')
+
+    def test_log_message(self):
+        """Tests that each level calls the matching method on every logger"""
+        for level in ('DEBUG', 'INFO', 'WARNING', 'ERROR'):
+            with self.subTest(level=level):
+                self.l1.reset_mock()
+                self.l2.reset_mock()
+                scroll_log.log_message(self.msg, 2, level, self.l1, self.l2)
+                expected = [getattr(call, level.lower())(
+                    self.msg, extra={'vlevel':2})]
+                for logger in (self.l1, self.l2):
+                    # Also catches calls to any other logger method
+                    self.assertEqual(logger.mock_calls, expected)
+
+    def test_log_message_exc_info(self):
+        """Tests that exception info goes to logger.exception instead"""
+        try:
+            raise TypeError("Oh no!")
+        except TypeError:
+            exc_info = sys.exc_info()
+        scroll_log.log_message(self.msg, 1, 'ERROR', self.l1, self.l2,
+                exc_info=exc_info)
+        expected = [call.exception(
+            self.msg, exc_info=exc_info, extra={'vlevel':1})]
+        for logger in (self.l1, self.l2):
+            self.assertEqual(logger.mock_calls, expected)
+
+    def test_get_generic_logname(self):
+        """Tests that the logname is built from the current time"""
+        test_now = datetime.datetime(2019, 1, 2, 3, 4, 5)
+        orig_datetime = scroll_log.datetime
+        # Swap the module attribute directly; only now() is needed
+        scroll_log.datetime = SimpleNamespace(
+                datetime=SimpleNamespace(now=lambda: test_now))
+        try:
+            logname = scroll_log._get_generic_logname('-')
+        finally:
+            scroll_log.datetime = orig_datetime
+        self.assertEqual(logname, "scrollpy-2019-01-02-03-04-05-log.txt")
+
+
+class TestBraceMessage(unittest.TestCase):
+    """Tests the BraceMessage class"""
+
+    MESSAGE = "A message with {} blank and {two} blank"
+    EXPECTED = "A message with one blank and another blank"
+
+    def setUp(self):
+        """Makes a new message object"""
+        self.b_msg = scroll_log.BraceMessage(
+                self.MESSAGE, 'one', two='another')
+
+    def test_str_not_wrapped(self):
+        """Tests that str() formats the message if not wrapped"""
+        self.assertEqual(str(self.b_msg), self.EXPECTED)
+
+    def test_str_wrapped(self):
+        """Tests that str() returns the wrapped message if present"""
+        self.b_msg.add_wrapped("A wrapped message")
+        self.assertEqual(str(self.b_msg), "A wrapped message")
+
+    def test_format_string(self):
+        """Tests that stored args are applied to any string"""
+        self.assertEqual(self.b_msg.format_string(self.MESSAGE),
+                self.EXPECTED)
+
+    def test_get_msg(self):
+        """Tests that the raw message is returned unformatted"""
+        self.assertEqual(self.b_msg.get_msg(), self.MESSAGE)
+
+    def test_has_lines(self):
+        """Tests has_lines() with and without lines"""
+        self.assertFalse(self.b_msg.has_lines())
+        self.b_msg.lines = ["line1", "line2"]
+        self.assertTrue(self.b_msg.has_lines())
+        self.assertEqual(self.b_msg.get_lines(), ["line1", "line2"])
+
+
+class TestGenericFilter(unittest.TestCase):
+    """Tests filtering based on verbosity in the base class"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Makes one filter for every test"""
+        cls.gfilter = scroll_log.GenericFilter(2)
+
+    def tearDown(self):
+        """Undo any change to the shared filter"""
+        self.gfilter.silent = False
+
+    def test_filter_silent(self):
+        """Tests that a silent filter rejects everything"""
+        self.gfilter.silent = True
+        record = SimpleNamespace(vlevel=1)
+        self.assertFalse(self.gfilter.filter(record))
+
+    def test_filter_verbosity_too_high(self):
+        """Tests that records above the verbosity are rejected"""
+        record = SimpleNamespace(vlevel=3)
+        self.assertFalse(self.gfilter.filter(record))
+
+    def test_filter_verbosity_ok(self):
+        """Tests that the base class can't modify accepted records"""
+        record = SimpleNamespace(vlevel=1)
+        with self.assertRaises(AttributeError):
+            self.gfilter.filter(record)
+
+    def test_get_text_wrapper_no_width(self):
+        """Tests that the filter width and header padding are used"""
+        wrapper = self.gfilter._get_text_wrapper()
+        self.assertEqual(wrapper.width, 78)
+        self.assertEqual(wrapper.initial_indent, '')
+        self.assertEqual(wrapper.subsequent_indent, ' ' * 10)
+
+    def test_get_text_wrapper_width(self):
+        """Tests that a given width and header override the defaults"""
+        wrapper = self.gfilter._get_text_wrapper(width=40, header='Test')
+        self.assertEqual(wrapper.width, 40)
+        self.assertEqual(wrapper.subsequent_indent, ' ' * 6)
+
+
+class TestConsoleFilter(unittest.TestCase):
+    """Tests message formatting for console output"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Makes one filter for every test; no test changes it"""
+        cls.cfilter = scroll_log.ConsoleFilter(2)
+
+    def test_filter_wraps_message(self):
+        """Tests that an accepted record gets a wrapped message"""
+        b_msg = scroll_log.BraceMessage("A {} message", 'short')
+        record = SimpleNamespace(vlevel=1, exc_info=None,
+                levelname='WARNING', msg=b_msg)
+        self.assertTrue(self.cfilter.filter(record))
+        self.assertEqual(str(b_msg), "ScrollPy [WARNING]: A short message")
+
+    def test_filter_wraps_long_message(self):
+        """Tests that wrapped lines line up with the text after the header"""
+        header = 'ScrollPy [WARNING]: '
+        b_msg = scroll_log.BraceMessage(' '.join(['word'] * 30))
+        record = SimpleNamespace(vlevel=1, exc_info=None,
+                levelname='WARNING', msg=b_msg)
+        self.cfilter.filter(record)
+        lines = str(b_msg).split('\n')
+        self.assertGreater(len(lines), 1)
+        self.assertTrue(lines[0].startswith(header + 'word'))
+        for line in lines[1:]:
+            with self.subTest(line=line):
+                self.assertTrue(line.startswith(' ' * len(header) + 'word'))
+
+    def test_add_header(self):
+        """Tests the header added for each level"""
+        for level, expected in ADD_HEADER_EXPECTED.items():
+            with self.subTest(level=level):
+                self.assertEqual(
+                        self.cfilter._add_header(level, 'A message.'),
+                        expected)
+
+    def test_format_message(self):
+        """Tests that the formatted message is handed to add_wrapped"""
+        mock_msg = Mock(spec_set=(
+            'get_msg', 'format_string', 'add_wrapped', 'has_lines'))
+        mock_msg.get_msg.return_value = "A {} message"
+        mock_msg.format_string.return_value = "A short message"
+        record = SimpleNamespace(levelname='INFO', msg=mock_msg)
+        self.cfilter._format_message(record)
+        self.assertEqual(mock_msg.mock_calls, [
+            call.get_msg(),
+            call.format_string("A {} message"),
+            call.add_wrapped("ScrollPy: A short message"),
+            ])
+
+
+if __name__ == '__main__':
+    unittest.main()
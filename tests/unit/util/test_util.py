@@ -0,0 +1,99 @@
+"""
+Module containing test code for helper functions in '_util.py'.
+"""
+
+import os
+import unittest
+from unittest.mock import patch, mock_open, call
+
+from scrollpy.util import _util as scroll_util
+
+
+# Built once at import; split_input() should cut the joined string back apart
+_LINE1 = '*' * 80
+_LINE2 = '^' * 40
+_TEST_STR = _LINE1 + _LINE2
+_EXPECTED_SPLIT = [_LINE1, _LINE2]
+
+
+class TestUtil(unittest.TestCase):
+    """Tests module-level helper functions"""
+
+    # Expected get_nonredundant_filepath() results for 0, 1 and 2 collisions
+    _EXPECTED_NRP = tuple(os.path.join('dir1', name) for name in (
+        'filename.txt', 'filename.txt.1', 'filename.txt.2'))
+
+    # decompose_sets() inputs are frozen; each test call gets a mutable copy
+    _TS1 = frozenset({('tup1','tup2'), ('tup1','tup3'), ('tup4','tup5')})
+    _EXP1 = {('tup1','tup2','tup3'), ('tup4','tup5')}
+    _TS2 = frozenset({('tup1','tup2'), ('tup3','tup4'), ('tup2','tup4'),
+        ('tup5','tup6'), ('tup6','tup7')})
+    _EXP2 = {('tup1','tup2','tup3','tup4'), ('tup5','tup6','tup7')}
+
+    def test_non_blank_lines(self):
+        """Tests that only lines with characters are yielded"""
+        data = "line1\n\nline2\nsome_other_line\n\n"
+        # Read from memory; no file is ever created on disk
+        with patch.object(scroll_util, 'open', mock_open(read_data=data),
+                create=True):
+            result = list(scroll_util.non_blank_lines('anything'))
+        self.assertEqual(result, ['line1\n', 'line2\n', 'some_other_line\n'])
+
+    def test_split_input(self):
+        """Tests splitting at the default and a larger chunk size"""
+        self.assertEqual(scroll_util.split_input(_TEST_STR), _EXPECTED_SPLIT)
+        self.assertEqual(scroll_util.split_input(_TEST_STR, chunk_size=200),
+                [_TEST_STR])
+
+    def test_check_input_paths(self):
+        """Tests that only paths that don't exist are returned"""
+        paths = ('path1', 'path2', 'path3')
+        cases = (
+                ((True, True, True), []),
+                ((True, False, True), ['path2']),
+                ((False, False, False), list(paths)),
+                )
+        with patch.object(scroll_util, 'file_exists') as mock_exists:
+            for exists, expected in cases:
+                with self.subTest(exists=exists):
+                    mock_exists.reset_mock()
+                    mock_exists.side_effect = exists
+                    self.assertEqual(
+                            scroll_util.check_input_paths(*paths), expected)
+                    # Plain list equality; every path is checked once, in order
+                    self.assertEqual(mock_exists.call_args_list,
+                            [call(path) for path in paths])
+
+    def test_check_duplicate_paths(self):
+        """Tests that each repeat of a path is returned"""
+        cases = (
+                (('path1', 'path2', 'path3'), []),
+                (('path1', 'path2', 'path1'), ['path1']),
+                (('path1', 'path1', 'path1'), ['path1', 'path1']),
+                )
+        for paths, expected in cases:
+            with self.subTest(paths=paths):
+                self.assertEqual(
+                        scroll_util.check_duplicate_paths(*paths), expected)
+
+    def test_get_nonredundant_filepath(self):
+        """Tests that a numeric suffix is added until the path is unique"""
+        sides = ((False,), (True, False), (True, True, False))
+        with patch.object(scroll_util.os.path, 'isfile') as mock_isfile:
+            for side, expected in zip(sides, self._EXPECTED_NRP):
+                with self.subTest(side=side):
+                    mock_isfile.side_effect = side
+                    self.assertEqual(scroll_util.get_nonredundant_filepath(
+                        'dir1', 'filename.txt'), expected)
+
+    def test_decompose_sets(self):
+        """Tests that overlapping tuples are merged transitively"""
+        for tuples, expected in ((self._TS1, self._EXP1),
+                (self._TS2, self._EXP2)):
+            with self.subTest(tuples=tuples):
+                self.assertEqual(scroll_util.decompose_sets(set(tuples)),
+                        expected)
+
+
+if __name__ == '__main__':
+    unittest.main()